@@ -10,15 +10,24 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.animation import FuncAnimation
-import random
 import time
 from datetime import datetime, timedelta
-import uuid
+
+# Numba é opcional: sem ele a detecção usa o caminho vetorizado do NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Configurações do pátio
 PATIO_WIDTH = 100  # largura do pátio em metros
 PATIO_HEIGHT = 80  # altura do pátio em metros
+MOVEMENT_SIGMA = 0.5  # desvio padrão do deslocamento aleatório por quadro, em metros
+COORD_DTYPE = np.float32  # coordenadas e distâncias (precisão de sobra para um pátio de 100 m)
 
 # Áreas do pátio
 AREAS = {
@@ -44,39 +53,137 @@ MOTO_MODELS = [
     'Sport 110i', 'CG 160', 'Factor 125', 'Biz 125', 'NMax 160', 'PCX 150'
 ]
 
+# Status das motos (a posição na lista é o código usado nos arrays da simulação)
+MOTO_STATUSES = ['disponível', 'reservada', 'em manutenção']
+STATUS_COLORS = ['green', 'blue', 'orange']
+
+# Capacidade do histórico de posições de cada moto (buffer circular)
+HISTORY_CAPACITY = 256
+
+# Capacidade inicial dos arrays de detecções de cada leitor
+DETECTION_CAPACITY = 1024
+
+# Faixas de combustível usadas no relatório
+FUEL_BINS = [0, 20, 50, 80, 101]
+FUEL_LABELS = ['crítico (<20%)', 'baixo (20-50%)', 'médio (50-80%)', 'alto (>80%)']
+
+def _detect_pairs_loop(reader_xy, reader_r2, moto_xy, out_pairs, out_d2):
+    """Detecta todos os pares (leitor, moto) dentro do alcance
+    
+    Grava os índices de cada par em `out_pairs` (M, 2) e a distância ao
+    quadrado em `out_d2`, ordenados por leitor, e retorna o número de pares.
+    Os buffers de saída devem comportar leitores x motos entradas; se encherem
+    antes disso, a busca para e retorna os pares já gravados.
+    """
+    count = 0
+    for r in range(reader_xy.shape[0]):
+        rx = reader_xy[r, 0]
+        ry = reader_xy[r, 1]
+        r2 = reader_r2[r]
+        for m in range(moto_xy.shape[0]):
+            dx = moto_xy[m, 0] - rx
+            dy = moto_xy[m, 1] - ry
+            d2 = dx*dx + dy*dy
+            if d2 <= r2:
+                if count == out_pairs.shape[0]:
+                    return count
+                out_pairs[count, 0] = r
+                out_pairs[count, 1] = m
+                out_d2[count] = d2
+                count += 1
+    return count
+
+
+def _detect_pairs_numpy(reader_xy, reader_r2, moto_xy, out_pairs, out_d2):
+    """Mesma interface de `_detect_pairs_loop`, usando broadcasting do NumPy"""
+    d2 = ((reader_xy[:, 0, None] - moto_xy[:, 0])**2
+          + (reader_xy[:, 1, None] - moto_xy[:, 1])**2)
+    reader_idx, moto_idx = np.nonzero(d2 <= reader_r2[:, None])
+    count = min(len(reader_idx), out_pairs.shape[0])
+    reader_idx = reader_idx[:count]
+    moto_idx = moto_idx[:count]
+    out_pairs[:count, 0] = reader_idx
+    out_pairs[:count, 1] = moto_idx
+    out_d2[:count] = d2[reader_idx, moto_idx]
+    return count
+
+
+if NUMBA_AVAILABLE:
+    _detect_pairs = njit(cache=True, fastmath=True)(_detect_pairs_loop)
+else:
+    _detect_pairs = _detect_pairs_numpy
+
+
 class Moto:
-    """Classe que representa uma moto com tag RFID"""
-    
-    def __init__(self, moto_id=None):
-        self.id = moto_id if moto_id else str(uuid.uuid4())[:8]
-        self.model = random.choice(MOTO_MODELS)
-        self.status = random.choice(['disponível', 'reservada', 'em manutenção'])
-        self.fuel_level = random.randint(10, 100)
-        self.last_maintenance = datetime.now() - timedelta(days=random.randint(0, 90))
-        
-        # Posição inicial
-        if self.status == 'em manutenção':
-            self.x = AREAS['manutencao']['x'] + random.randint(5, AREAS['manutencao']['width'] - 5)
-            self.y = AREAS['manutencao']['y'] + random.randint(2, AREAS['manutencao']['height'] - 2)
-        else:
-            self.x = AREAS['estacionamento']['x'] + random.randint(5, AREAS['estacionamento']['width'] - 5)
-            self.y = AREAS['estacionamento']['y'] + random.randint(5, AREAS['estacionamento']['height'] - 5)
+    """Classe que representa uma moto com tag RFID
+    
+    Posição, status e combustível ficam nos arrays da simulação; a moto guarda
+    apenas seu índice nesses arrays.
+    """
+    
+    def __init__(self, patio, index, moto_id, model, last_maintenance):
+        self._patio = patio
+        self._index = index
+        self.id = moto_id
+        self.model = model
+        self.last_maintenance = last_maintenance
         
-        # Histórico de movimentação
-        self.movement_history = []
+        # Histórico de movimentação em colunas (buffer circular)
+        self._hist_ts = np.zeros(HISTORY_CAPACITY, dtype=np.int64)
+        self._hist_x = np.zeros(HISTORY_CAPACITY, dtype=COORD_DTYPE)
+        self._hist_y = np.zeros(HISTORY_CAPACITY, dtype=COORD_DTYPE)
+        self._hist_status = np.zeros(HISTORY_CAPACITY, dtype=np.int8)
+        self._hist_fuel = np.zeros(HISTORY_CAPACITY, dtype=np.int8)
+        self._hist_len = 0
         self.record_position()
-        
-        # Cor baseada no status
-        self.update_color()
-    
-    def update_color(self):
-        """Atualiza a cor da moto baseada em seu status"""
-        if self.status == 'disponível':
-            self.color = 'green'
-        elif self.status == 'reservada':
-            self.color = 'blue'
-        else:  # em manutenção
-            self.color = 'orange'
+    
+    @property
+    def x(self):
+        """Posição X da moto (metros)"""
+        return float(self._patio._moto_xy[self._index, 0])
+    
+    @x.setter
+    def x(self, value):
+        self._patio._moto_xy[self._index, 0] = value
+        self._patio.mark_dirty()
+    
+    @property
+    def y(self):
+        """Posição Y da moto (metros)"""
+        return float(self._patio._moto_xy[self._index, 1])
+    
+    @y.setter
+    def y(self, value):
+        self._patio._moto_xy[self._index, 1] = value
+        self._patio.mark_dirty()
+    
+    @property
+    def status(self):
+        """Status atual da moto, um dos valores de `MOTO_STATUSES`"""
+        return MOTO_STATUSES[self._patio._status_codes[self._index]]
+    
+    @status.setter
+    def status(self, value):
+        if value not in MOTO_STATUSES:
+            raise ValueError(f"Status inválido: {value!r}. Use um de {MOTO_STATUSES}")
+        self._patio._status_codes[self._index] = MOTO_STATUSES.index(value)
+        self._patio.mark_dirty()
+    
+    @property
+    def fuel_level(self):
+        """Nível de combustível (%)"""
+        return int(self._patio._fuel[self._index])
+    
+    @fuel_level.setter
+    def fuel_level(self, value):
+        # O array usa int8: o nível é mantido entre 0 e 100%
+        self._patio._fuel[self._index] = max(0, min(100, value))
+        self._patio.mark_dirty()
+    
+    @property
+    def color(self):
+        """Cor da moto baseada em seu status"""
+        return STATUS_COLORS[self._patio._status_codes[self._index]]
     
     def move(self, dx, dy):
         """Move a moto em uma direção específica"""
@@ -89,20 +196,39 @@ class Moto:
         
         self.record_position()
     
-    def record_position(self):
-        """Registra a posição atual no histórico"""
-        self.movement_history.append({
-            'timestamp': datetime.now(),
-            'x': self.x,
-            'y': self.y,
-            'status': self.status,
-            'fuel_level': self.fuel_level
-        })
+    def record_position(self, ts=None):
+        """Registra a posição atual no histórico
+        
+        `ts` é o instante em nanossegundos de `time.monotonic_ns()`; por padrão,
+        o relógio da simulação.
+        """
+        i = self._hist_len % HISTORY_CAPACITY
+        self._hist_ts[i] = self._patio.now_ns() if ts is None else ts
+        self._hist_x[i] = self.x
+        self._hist_y[i] = self.y
+        self._hist_status[i] = self._patio._status_codes[self._index]
+        self._hist_fuel[i] = self._patio._fuel[self._index]
+        self._hist_len += 1
+    
+    @property
+    def movement_history(self):
+        """Histórico de posições em ordem cronológica, como colunas
+        
+        Apenas as últimas `HISTORY_CAPACITY` posições são mantidas.
+        """
+        n = min(self._hist_len, HISTORY_CAPACITY)
+        order = (np.arange(n) + self._hist_len - n) % HISTORY_CAPACITY
+        return {
+            'timestamp': self._hist_ts[order],
+            'x': self._hist_x[order],
+            'y': self._hist_y[order],
+            'status': self._hist_status[order],
+            'fuel_level': self._hist_fuel[order]
+        }
     
     def update_status(self, new_status):
         """Atualiza o status da moto"""
         self.status = new_status
-        self.update_color()
         self.record_position()
     
     def update_fuel(self, amount):
@@ -112,7 +238,7 @@ class Moto:
     
     def perform_maintenance(self):
         """Realiza manutenção na moto"""
-        self.last_maintenance = datetime.now()
+        self.last_maintenance = self._patio.now()
         self.fuel_level = 100
         self.update_status('disponível')
     
@@ -123,53 +249,218 @@ class Moto:
 class RFIDReader:
     """Classe que representa um leitor RFID"""
     
-    def __init__(self, reader_id, x, y, detection_range, color='red', name=None):
+    def __init__(self, reader_id, x, y, detection_range, color='red', name=None,
+                 clock=time.monotonic_ns):
         self.id = reader_id
         self.x = x
         self.y = y
         self.range = detection_range
+        # Alcance ao quadrado: a comparação é feita sem raiz quadrada
+        self.range2 = detection_range * detection_range
         self.color = color
         self.name = name
-        self.detections = []
-    
-    def detect_motos(self, motos):
-        """Detecta motos dentro do alcance do leitor"""
-        detected = []
-        for moto in motos:
-            distance = np.sqrt((self.x - moto.x)**2 + (self.y - moto.y)**2)
-            if distance <= self.range:
-                detected.append(moto)
-                self.record_detection(moto)
+        # Função que fornece o instante atual em nanossegundos
+        self.clock = clock
+        
+        # Detecções em colunas paralelas; apenas as `_n` primeiras posições são válidas
+        self.detections_ts = np.zeros(DETECTION_CAPACITY, dtype=np.int64)
+        self.detections_moto_idx = np.zeros(DETECTION_CAPACITY, dtype=np.int32)
+        self.detections_x = np.zeros(DETECTION_CAPACITY, dtype=COORD_DTYPE)
+        self.detections_y = np.zeros(DETECTION_CAPACITY, dtype=COORD_DTYPE)
+        self.detections_d2 = np.zeros(DETECTION_CAPACITY, dtype=COORD_DTYPE)
+        self._n = 0
+    
+    def detect_motos(self, motos, xy=None):
+        """Detecta motos dentro do alcance do leitor
+        
+        `xy` é um array (N, 2) com as posições de `motos`; se não for informado,
+        é montado a partir das próprias motos.
+        """
+        if xy is None:
+            xy = np.array([(moto.x, moto.y) for moto in motos], dtype=COORD_DTYPE).reshape(-1, 2)
+        
+        # Distância ao quadrado calculada de uma vez para todas as motos
+        dx = xy[:, 0] - self.x
+        dy = xy[:, 1] - self.y
+        d2 = dx*dx + dy*dy
+        indices = np.flatnonzero(d2 <= self.range2)
+        
+        detected = [motos[i] for i in indices]
+        # Registrar o índice de cada moto na simulação, não a posição em `motos`
+        self.record_detections([moto._index for moto in detected], xy[indices], d2[indices])
         return detected
     
-    def record_detection(self, moto):
-        """Registra uma detecção de moto"""
-        self.detections.append({
-            'timestamp': datetime.now(),
-            'moto_id': moto.id,
-            'moto_model': moto.model,
-            'moto_status': moto.status,
-            'moto_x': moto.x,
-            'moto_y': moto.y,
-            'distance': np.sqrt((self.x - moto.x)**2 + (self.y - moto.y)**2)
-        })
+    def record_detection(self, moto, distance, ts=None):
+        """Registra uma detecção de moto
+        
+        `distance` é a distância já calculada por quem detectou a moto; ela não
+        é recalculada aqui.
+        """
+        self.record_detections([moto._index], [(moto.x, moto.y)], [distance * distance], ts)
+    
+    def record_detections(self, moto_idx, xy, d2, ts=None):
+        """Registra em lote as detecções de várias motos
+        
+        `moto_idx` são os índices das motos na simulação, `xy` suas posições e
+        `d2` a distância ao quadrado até o leitor. `ts` é o instante em
+        nanossegundos de `time.monotonic_ns()`, compartilhado por todo o lote;
+        por padrão, o valor de `clock`.
+        """
+        count = len(moto_idx)
+        if count == 0:
+            return
+        if ts is None:
+            ts = self.clock()
+        self._reserve(count)
+        
+        xy = np.asarray(xy).reshape(-1, 2)
+        start, end = self._n, self._n + count
+        self.detections_ts[start:end] = ts
+        self.detections_moto_idx[start:end] = moto_idx
+        self.detections_x[start:end] = xy[:, 0]
+        self.detections_y[start:end] = xy[:, 1]
+        self.detections_d2[start:end] = d2
+        self._n = end
+    
+    def _reserve(self, count):
+        """Garante espaço para mais `count` detecções, dobrando a capacidade"""
+        capacity = len(self.detections_ts)
+        if self._n + count <= capacity:
+            return
+        capacity = max(self._n + count, 2 * capacity)
+        for name in ('detections_ts', 'detections_moto_idx', 'detections_x',
+                     'detections_y', 'detections_d2'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
     
-    def get_recent_detections(self, seconds=60):
+    @property
+    def detections(self):
+        """Todas as detecções registradas, como colunas"""
+        return self._detection_columns(0)
+    
+    def _detection_columns(self, start):
+        """Retorna as colunas de detecções a partir da posição `start`"""
+        n = self._n
+        return {
+            'timestamp': self.detections_ts[start:n],
+            'moto_idx': self.detections_moto_idx[start:n],
+            'x': self.detections_x[start:n],
+            'y': self.detections_y[start:n],
+            'd2': self.detections_d2[start:n]
+        }
+    
+    def get_recent_detections(self, seconds=60, now_ns=None):
         """Retorna detecções recentes"""
-        cutoff_time = datetime.now() - timedelta(seconds=seconds)
-        return [d for d in self.detections if d['timestamp'] > cutoff_time]
+        if now_ns is None:
+            now_ns = self.clock()
+        cutoff = now_ns - int(seconds * 1e9)
+        # As detecções são gravadas em ordem cronológica
+        start = np.searchsorted(self.detections_ts[:self._n], cutoff, side='right')
+        return self._detection_columns(start)
 
 
 class MottuPatioSimulation:
     """Classe principal para simulação do pátio da Mottu com sistema RFID"""
     
-    def __init__(self, num_motos=30):
-        self.motos = [Moto() for _ in range(num_motos)]
-        self.readers = [RFIDReader(r['id'], r['x'], r['y'], r['range'], r['color'], r.get('name')) for r in READERS]
+    def __init__(self, num_motos=30, rng=None):
+        # Um único gerador (PCG64) para todos os sorteios da simulação
+        self._rng = rng if rng is not None else np.random.default_rng()
+        self.readers = [RFIDReader(r['id'], r['x'], r['y'], r['range'], r['color'], r.get('name'),
+                                   clock=self.now_ns) for r in READERS]
         self.events_log = []
-        self.current_time = datetime.now()
+        # Posições e alcances dos leitores, fixos durante a simulação
+        self._reader_xy = np.array([(r.x, r.y) for r in self.readers], dtype=COORD_DTYPE).reshape(-1, 2)
+        self._reader_range2 = np.array([r.range2 for r in self.readers], dtype=COORD_DTYPE)
+        # Enquanto nenhuma moto mudar, o quadro reaproveita a última detecção
+        self._dirty = True
+        self._detection_cache = None
+        # Enquanto um quadro está em andamento, todos os registros usam o mesmo instante
+        self._in_frame = True
+        self.update_clock()
+        self.create_motos(num_motos)
+        self._in_frame = False
         self.setup_visualization()
     
+    def update_clock(self):
+        """Fixa o instante do quadro atual, usado por todos os registros do quadro
+        
+        `current_time` (datetime) serve para datas exibidas; `current_time_ns`
+        (de `time.monotonic_ns()`) carimba históricos e detecções.
+        """
+        self.current_time = datetime.now()
+        self.current_time_ns = time.monotonic_ns()
+    
+    def now(self):
+        """Instante atual: o do quadro em andamento ou, fora dele, o do relógio"""
+        return self.current_time if self._in_frame else datetime.now()
+    
+    def now_ns(self):
+        """Mesmo que `now`, em nanossegundos de `time.monotonic_ns()`"""
+        return self.current_time_ns if self._in_frame else time.monotonic_ns()
+    
+    def mark_dirty(self):
+        """Indica que alguma moto mudou e o próximo quadro deve ser recalculado"""
+        self._dirty = True
+    
+    def create_motos(self, num_motos):
+        """Sorteia as propriedades de todas as motos de uma só vez
+        
+        Posição (N, 2), código de status e combustível ficam em arrays da
+        simulação; cada `Moto` é uma vista sobre seu índice nesses arrays.
+        """
+        rng = self._rng
+        models = rng.integers(0, len(MOTO_MODELS), num_motos)
+        statuses = rng.integers(0, len(MOTO_STATUSES), num_motos)
+        fuel = rng.integers(10, 101, num_motos)
+        maintenance_days = rng.integers(0, 91, num_motos)
+        # Identificadores de 8 dígitos hexadecimais (32 bits)
+        ids = [f"{value:08x}" for value in rng.integers(0, 2**32, num_motos, dtype=np.uint32)]
+        
+        # Posição inicial: motos em manutenção ficam na área de manutenção
+        manut = AREAS['manutencao']
+        estac = AREAS['estacionamento']
+        in_maintenance = statuses == MOTO_STATUSES.index('em manutenção')
+        x = np.where(in_maintenance,
+                     manut['x'] + rng.integers(5, manut['width'] - 5 + 1, num_motos),
+                     estac['x'] + rng.integers(5, estac['width'] - 5 + 1, num_motos))
+        y = np.where(in_maintenance,
+                     manut['y'] + rng.integers(2, manut['height'] - 2 + 1, num_motos),
+                     estac['y'] + rng.integers(5, estac['height'] - 5 + 1, num_motos))
+        
+        self._moto_xy = np.column_stack([x, y]).astype(COORD_DTYPE)
+        self._status_codes = statuses.astype(np.int8)
+        self._fuel = fuel.astype(np.int8)
+        
+        self.motos = [
+            Moto(self, i, moto_id, MOTO_MODELS[model], self.current_time - timedelta(days=int(days)))
+            for i, (moto_id, model, days) in enumerate(zip(ids, models, maintenance_days))
+        ]
+        # Buffers de saída da detecção, com espaço para todos os pares possíveis
+        self._pairs = np.empty((len(self.readers) * num_motos, 2), dtype=np.int32)
+        self._pairs_d2 = np.empty(len(self.readers) * num_motos, dtype=COORD_DTYPE)
+        self.mark_dirty()
+    
+    def detect_all(self):
+        """Detecta as motos de todos os leitores de uma só vez
+        
+        Retorna os índices (leitor, moto) dos pares dentro do alcance, ordenados
+        por leitor, a distância ao quadrado de cada par e o número de detecções
+        por leitor.
+        """
+        count = _detect_pairs(self._reader_xy, self._reader_range2, self._moto_xy,
+                              self._pairs, self._pairs_d2)
+        reader_idx = self._pairs[:count, 0]
+        moto_idx = self._pairs[:count, 1]
+        counts = np.bincount(reader_idx, minlength=len(self.readers))
+        return reader_idx, moto_idx, self._pairs_d2[:count], counts
+    
+    def count_statuses(self):
+        """Conta as motos em cada status"""
+        counts = np.bincount(self._status_codes, minlength=len(MOTO_STATUSES))
+        return dict(zip(MOTO_STATUSES, counts.tolist()))
+    
     def setup_visualization(self):
         """Configura a visualização do pátio"""
         self.fig, self.ax = plt.subplots(figsize=(12, 10))
@@ -193,31 +484,33 @@ class MottuPatioSimulation:
                 name.upper(), ha='center', va='center'
             )
         
-        # Desenhar leitores RFID
-        self.reader_points = []
-        self.reader_ranges = []
+        # Desenhar leitores RFID (uma coleção para os pontos e outra para os alcances)
+        reader_colors = [reader.color for reader in self.readers]
+        self.reader_points = self.ax.scatter(self._reader_xy[:, 0], self._reader_xy[:, 1],
+                                             c=reader_colors, s=100, marker='s')
+        self.reader_ranges = PatchCollection(
+            [plt.Circle((reader.x, reader.y), reader.range) for reader in self.readers],
+            facecolors='none', edgecolors=reader_colors, alpha=0.3
+        )
+        self.ax.add_collection(self.reader_ranges)
         for reader in self.readers:
-            point = self.ax.plot([reader.x], [reader.y], 's', color=reader.color, markersize=10)[0]
-            range_circle = plt.Circle((reader.x, reader.y), reader.range, 
-                                     color=reader.color, fill=False, alpha=0.3)
-            self.ax.add_artist(range_circle)
             # Usar nome personalizado se disponível, caso contrário usar ID
             if hasattr(reader, 'name') and reader.name:
                 display_name = reader.name
             else:
                 display_name = f"Leitor {reader.id}"
             self.ax.text(reader.x, reader.y-5, display_name, ha='center')
-            self.reader_points.append(point)
-            self.reader_ranges.append(range_circle)
         
-        # Desenhar motos
-        self.moto_points = []
-        for moto in self.motos:
-            point = self.ax.plot([moto.x], [moto.y], 's', color=moto.color, markersize=8)[0]
-            self.moto_points.append(point)
+        # Desenhar motos em uma única coleção, colorida pelo código de status
+        self._status_rgba = to_rgba_array(STATUS_COLORS)
+        self.moto_scatter = self.ax.scatter(self._moto_xy[:, 0], self._moto_xy[:, 1],
+                                            c=self._status_rgba[self._status_codes],
+                                            s=64, marker='s', animated=True)
         
         # Informações de status - MOVIDA PARA A ESQUERDA
-        self.status_text = self.ax.text(5, 5, '', fontsize=10, 
+        # Motos e status são animados: ficam fora do fundo salvo para o blit
+        self.status_text = self.ax.text(0.05, 0.0625, '', fontsize=10,
+                                       transform=self.ax.transAxes, animated=True,
                                        bbox=dict(facecolor='white', alpha=0.7))
         
         # Legenda colorida - MOVIDA PARA PARTE INFERIOR DIREITA
@@ -227,47 +520,72 @@ class MottuPatioSimulation:
     
     def update_visualization(self, frame):
         """Atualiza a visualização do pátio"""
-        # Atualizar posição das motos
-        for i, moto in enumerate(self.motos):
-            if i < len(self.moto_points):
-                self.moto_points[i].set_data([moto.x], [moto.y])
-                self.moto_points[i].set_color(moto.color)
+        # Um único instante para todos os eventos do quadro
+        self.update_clock()
+        self._in_frame = True
+        try:
+            return self.draw_frame()
+        finally:
+            self._in_frame = False
+    
+    def draw_frame(self):
+        """Detecta as motos e atualiza os artistas do quadro atual"""
+        now_ns = self.current_time_ns
         
-        # Detectar motos com leitores RFID
-        all_detections = []
-        for reader in self.readers:
-            detected = reader.detect_motos(self.motos)
-            all_detections.extend([{
-                'reader_id': reader.id,
-                'moto_id': moto.id,
-                'timestamp': datetime.now()
-            } for moto in detected])
+        changed = self._dirty
+        if changed:
+            # Atualizar posição e cor de todas as motos de uma vez
+            self.moto_scatter.set_offsets(self._moto_xy)
+            self.moto_scatter.set_facecolors(self._status_rgba[self._status_codes])
+            
+            # Detectar motos com leitores RFID
+            self._detection_cache = self.detect_all()
+            self._dirty = False
         
-        # Atualizar texto de status
-        status_counts = {
-            'disponível': sum(1 for moto in self.motos if moto.status == 'disponível'),
-            'reservada': sum(1 for moto in self.motos if moto.status == 'reservada'),
-            'em manutenção': sum(1 for moto in self.motos if moto.status == 'em manutenção')
-        }
+        # Os leitores continuam lendo as tags a cada quadro, mesmo sem mudanças
+        reader_idx, moto_idx, d2, counts = self._detection_cache
+        # Os pares vêm ordenados por leitor, então basta dividir pelos totais
+        bounds = np.cumsum(counts)[:-1]
+        total_detections = 0
+        for reader, indices, reader_d2 in zip(self.readers, np.split(moto_idx, bounds),
+                                              np.split(d2, bounds)):
+            reader.record_detections(indices, self._moto_xy[indices], reader_d2, now_ns)
+            total_detections += len(indices)
         
-        status_text = f"Total de Motos: {len(self.motos)}\n"
-        status_text += f"Disponíveis: {status_counts['disponível']}\n"
-        status_text += f"Reservadas: {status_counts['reservada']}\n"
-        status_text += f"Em Manutenção: {status_counts['em manutenção']}\n"
-        status_text += f"Detecções RFID: {len(all_detections)}\n"
-        status_text += f"(Uma moto pode ser detectada\npor múltiplos leitores)"
-        
-        self.status_text.set_text(status_text)
+        # Atualizar texto de status (só muda quando alguma moto muda)
+        if changed:
+            status_counts = self.count_statuses()
+            
+            status_text = f"Total de Motos: {len(self.motos)}\n"
+            status_text += f"Disponíveis: {status_counts['disponível']}\n"
+            status_text += f"Reservadas: {status_counts['reservada']}\n"
+            status_text += f"Em Manutenção: {status_counts['em manutenção']}\n"
+            status_text += f"Detecções RFID: {total_detections}\n"
+            status_text += f"(Uma moto pode ser detectada\npor múltiplos leitores)"
+            
+            self.status_text.set_text(status_text)
         
         # REMOVIDO: Não simular movimentos aleatórios para as motos ficarem estáticas
         # self.simulate_movements()
         
-        return self.moto_points + [self.status_text]
+        # Com blit, uma lista vazia faria o FuncAnimation redesenhar a figura
+        # inteira; devolver só os dois artistas animados mantém o quadro barato
+        return [self.moto_scatter, self.status_text]
     
     def simulate_movements(self):
         """Simula movimentos aleatórios das motos"""
         # Esta função não é mais chamada para manter as motos estáticas
-        pass
+        self.simulate_movements_vectorized()
+    
+    def simulate_movements_vectorized(self, sigma=MOVEMENT_SIGMA):
+        """Desloca todas as motos aleatoriamente, mantendo-as dentro do pátio
+        
+        Atua diretamente no array de posições; o histórico individual de cada
+        moto só é registrado por `Moto.move`.
+        """
+        self._moto_xy += sigma * self._rng.standard_normal(self._moto_xy.shape, dtype=COORD_DTYPE)
+        np.clip(self._moto_xy, 0, [PATIO_WIDTH, PATIO_HEIGHT], out=self._moto_xy)
+        self.mark_dirty()
     
     def run_simulation(self, frames=100, interval=200):
         """Executa a simulação animada"""
@@ -280,32 +598,56 @@ class MottuPatioSimulation:
     
     def generate_report(self):
         """Gera um relatório com estatísticas da simulação"""
+        motos = self.motos_dataframe()
+        fuel_bands = pd.cut(motos['fuel_level'], FUEL_BINS, labels=FUEL_LABELS, right=False)
         report = {
-            'total_motos': len(self.motos),
-            'status_counts': {
-                'disponível': sum(1 for moto in self.motos if moto.status == 'disponível'),
-                'reservada': sum(1 for moto in self.motos if moto.status == 'reservada'),
-                'em manutenção': sum(1 for moto in self.motos if moto.status == 'em manutenção')
-            },
-            'fuel_levels': {
-                'crítico (<20%)': sum(1 for moto in self.motos if moto.fuel_level < 20),
-                'baixo (20-50%)': sum(1 for moto in self.motos if 20 <= moto.fuel_level < 50),
-                'médio (50-80%)': sum(1 for moto in self.motos if 50 <= moto.fuel_level < 80),
-                'alto (>80%)': sum(1 for moto in self.motos if moto.fuel_level >= 80)
-            },
-            'reader_detections': {reader.id: len(reader.detections) for reader in self.readers}
+            'total_motos': len(motos),
+            'status_counts': motos['status'].value_counts(sort=False).to_dict(),
+            'fuel_levels': fuel_bands.value_counts(sort=False).to_dict(),
+            'reader_detections': {reader.id: reader._n for reader in self.readers},
+            'motos': motos,
+            'detections': self.detections_dataframe()
         }
         return report
+    
+    def motos_dataframe(self):
+        """Reúne os dados de todas as motos em um único DataFrame"""
+        return pd.DataFrame({
+            'id': [moto.id for moto in self.motos],
+            'model': [moto.model for moto in self.motos],
+            'status': pd.Categorical.from_codes(self._status_codes, MOTO_STATUSES),
+            'fuel_level': self._fuel,
+            'x': self._moto_xy[:, 0],
+            'y': self._moto_xy[:, 1]
+        })
+    
+    def detections_dataframe(self):
+        """Reúne as detecções de todos os leitores em um único DataFrame"""
+        columns = [reader.detections for reader in self.readers]
+        moto_ids = np.array([moto.id for moto in self.motos], dtype=object)
+        d2 = np.concatenate([c['d2'] for c in columns])
+        return pd.DataFrame({
+            'timestamp_ns': np.concatenate([c['timestamp'] for c in columns]),
+            'reader_id': np.repeat([reader.id for reader in self.readers],
+                                   [len(c['d2']) for c in columns]),
+            'moto_id': moto_ids[np.concatenate([c['moto_idx'] for c in columns])],
+            'x': np.concatenate([c['x'] for c in columns]),
+            'y': np.concatenate([c['y'] for c in columns]),
+            'distance': np.sqrt(d2)
+        })
 
 
 # Função para executar a simulação
-def run_mottu_rfid_simulation(num_motos=30, frames=200, interval=200):
-    """Executa a simulação do sistema RFID da Mottu"""
+def run_mottu_rfid_simulation(num_motos=30, frames=200, interval=200, seed=None):
+    """Executa a simulação do sistema RFID da Mottu
+    
+    `seed` torna a simulação reproduzível.
+    """
     print("Iniciando simulação do sistema RFID para o pátio da Mottu...")
     print(f"Número de motos: {num_motos}")
     print(f"Número de leitores RFID: {len(READERS)}")
     
-    simulation = MottuPatioSimulation(num_motos=num_motos)
+    simulation = MottuPatioSimulation(num_motos=num_motos, rng=np.random.default_rng(seed))
     simulation.run_simulation(frames=frames, interval=interval)
     
     report = simulation.generate_report()
@@ -0,0 +1,175 @@
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import rfidSimulator as rs
+
+
+def test_detect_motos_subset_records_simulation_indices():
+    sim = rs.MottuPatioSimulation(num_motos=30)
+    reader = rs.RFIDReader(99, 50, 40, 60)
+    detected = reader.detect_motos(sim.motos[10:])
+
+    recorded = reader.detections['moto_idx']
+    assert list(recorded) == [moto._index for moto in detected]
+    assert [sim.motos[i].id for i in recorded] == [moto.id for moto in detected]
+
+
+def test_records_outside_a_frame_use_the_current_time(monkeypatch):
+    clock = {'ns': 1_000_000_000, 'dt': rs.datetime(2025, 1, 1, 12, 0)}
+
+    class FakeDatetime(rs.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock['dt']
+
+    monkeypatch.setattr(rs.time, 'monotonic_ns', lambda: clock['ns'])
+    monkeypatch.setattr(rs, 'datetime', FakeDatetime)
+
+    sim = rs.MottuPatioSimulation(num_motos=5)
+    sim.update_visualization(0)
+    assert sim.current_time_ns == 1_000_000_000
+
+    clock['ns'] += 1
+    clock['dt'] += rs.timedelta(seconds=1)
+    moto = sim.motos[0]
+    moto.move(1, 1)
+    moto.perform_maintenance()
+    assert moto.movement_history['timestamp'][-1] == clock['ns']
+    assert moto.last_maintenance == clock['dt']
+
+    reader = sim.readers[0]
+    reader.record_detections([0], [(moto.x, moto.y)], [1.0])
+    assert reader.detections['timestamp'][-1] == clock['ns']
+
+
+def test_records_inside_a_frame_share_the_frame_time():
+    sim = rs.MottuPatioSimulation(num_motos=30)
+    sim.update_visualization(0)
+    stamps = np.concatenate([r.detections['timestamp'] for r in sim.readers])
+    assert len(stamps) > 0
+    assert (stamps == sim.current_time_ns).all()
+
+
+def test_report_counts_match_recorded_detections():
+    sim = rs.MottuPatioSimulation(num_motos=30)
+    sim.update_visualization(0)
+    sim.readers[2].detect_motos(sim.motos)
+
+    report = sim.generate_report()
+    per_reader = report['detections']['reader_id'].value_counts().to_dict()
+    for reader_id, count in report['reader_detections'].items():
+        assert count == per_reader.get(reader_id, 0)
+
+
+def test_fuel_level_setter_clamps_to_valid_range():
+    sim = rs.MottuPatioSimulation(num_motos=1)
+    moto = sim.motos[0]
+    moto.fuel_level = 200
+    assert moto.fuel_level == 100
+    moto.fuel_level = -5
+    assert moto.fuel_level == 0
+
+
+def test_create_motos_resizes_detection_buffers():
+    sim = rs.MottuPatioSimulation(num_motos=5)
+    sim.update_visualization(0)
+    sim.create_motos(2000)
+    sim.update_visualization(1)
+
+    reader_idx, moto_idx, d2, counts = sim._detection_cache
+    assert len(sim._pairs) == len(sim.readers) * 2000
+    assert counts.sum() == len(moto_idx) == len(d2)
+    assert moto_idx.max(initial=0) < 2000
+
+
+def test_detection_kernels_agree():
+    sim = rs.MottuPatioSimulation(num_motos=500, rng=np.random.default_rng(42))
+    kernels = [rs._detect_pairs_numpy, rs._detect_pairs_loop]
+    if rs.NUMBA_AVAILABLE:
+        kernels[1] = rs._detect_pairs
+
+    results = []
+    for kernel in kernels:
+        pairs = np.empty_like(sim._pairs)
+        d2 = np.empty_like(sim._pairs_d2)
+        count = kernel(sim._reader_xy, sim._reader_range2, sim._moto_xy, pairs, d2)
+        results.append((count, pairs[:count], d2[:count]))
+
+    (count_np, pairs_np, d2_np), (count_loop, pairs_loop, d2_loop) = results
+    assert count_np == count_loop > 0
+    assert (pairs_np == pairs_loop).all()
+    assert (np.diff(pairs_np[:, 0]) >= 0).all()
+    assert np.allclose(d2_np, d2_loop)
+
+
+def test_recent_detections_exclude_the_cutoff_instant():
+    now = [0]
+    reader = rs.RFIDReader(99, 50, 40, 60, clock=lambda: now[0])
+    start_ns = 1_000_000_000_000
+    for moto_idx, ts in enumerate([start_ns, start_ns + 1]):
+        reader.record_detections([moto_idx], [(0, 0)], [1.0], ts=ts)
+
+    now[0] = start_ns + 60 * 10**9
+    recent = reader.get_recent_detections(60)
+    assert list(recent['moto_idx']) == [1]
+    assert list(recent['timestamp']) == [start_ns + 1]
+
+    recent = reader.get_recent_detections(60, now_ns=start_ns + 60 * 10**9 - 1)
+    assert list(recent['moto_idx']) == [0, 1]
+
+
+def test_fuel_levels_use_the_band_edges():
+    sim = rs.MottuPatioSimulation(num_motos=7)
+    for moto, fuel in zip(sim.motos, [19, 20, 49, 50, 79, 80, 100]):
+        moto.fuel_level = fuel
+
+    fuel_levels = sim.generate_report()['fuel_levels']
+    assert fuel_levels == {
+        'crítico (<20%)': 1,
+        'baixo (20-50%)': 2,
+        'médio (50-80%)': 2,
+        'alto (>80%)': 2,
+    }
+
+
+def test_vectorized_movement_stays_inside_the_patio():
+    sim = rs.MottuPatioSimulation(num_motos=200, rng=np.random.default_rng(7))
+    sim._dirty = False
+    sim.simulate_movements_vectorized(sigma=500)
+
+    xy = sim._moto_xy
+    assert xy.dtype == np.float32
+    assert (xy[:, 0] >= 0).all() and (xy[:, 0] <= rs.PATIO_WIDTH).all()
+    assert (xy[:, 1] >= 0).all() and (xy[:, 1] <= rs.PATIO_HEIGHT).all()
+    assert sim._dirty
+
+
+def test_clean_frames_reuse_the_detection_cache():
+    sim = rs.MottuPatioSimulation(num_motos=30, rng=np.random.default_rng(3))
+    sim.update_visualization(0)
+    cache = sim._detection_cache
+    sim.status_text.set_text('sentinela')
+
+    sim.update_visualization(1)
+    assert sim._detection_cache is cache
+    assert sim.status_text.get_text() == 'sentinela'
+
+    sim.motos[0].status = 'em manutenção'
+    assert sim._dirty
+    sim.update_visualization(2)
+    assert sim._detection_cache is not cache
+    assert not sim._dirty
+    assert sim.status_text.get_text().startswith('Total de Motos: 30')
+
+
+def test_status_setter_rejects_unknown_status():
+    sim = rs.MottuPatioSimulation(num_motos=1)
+    moto = sim.motos[0]
+    with pytest.raises(ValueError, match='disponível'):
+        moto.status = 'perdida'